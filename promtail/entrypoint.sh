@@ -5,7 +5,7 @@ cp /etc/promtail/global.yml /promtail-config.yml
 
 # Add custom loki urls to config with indentation to make sure its valid yml
 if [ -s "/etc/promtail/custom-lokiurl.yml" ]; then
-  echo "/etc/promtail/custom-lokiurl.yml" | xargs sed 's/^/  /' >> /promtail-config.yml
+  sed 's/^/  /' /etc/promtail/custom-lokiurl.yml >> /promtail-config.yml
 else
 cat >> /promtail-config.yml << EOF
   - url: http://loki:3100/loki/api/v1/push